@@ -13,59 +13,63 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import pygame
+import numpy as np
 import sys
 import os
-import configparser # For INI file handling
-import ast          # For safely evaluating tuples from strings
-import subprocess   # For opening file location
-import tkinter as tk
-from tkinter import filedialog, simpledialog, messagebox # Keep for file dialogs
+import math
+import functools
+import bisect
+import re
+import threading
+import queue
 import pygame_gui
+# tkinter (file dialogs, clipboard) and subprocess (opening file location) are imported where
+# they are used, since they are only needed on rare user actions and slow down startup
 
-# --- Helper function to find theme file ---
+# --- Helper functions for theme file and fonts ---
+@functools.cache
 def get_theme_file_path(filename="theme.json"):
     """
     Determines the path to the theme file.
-    Priority:
-    1. External file next to the executable (or script in dev mode).
-    2. Bundled file (if running as a PyInstaller app).
-    3. File in the current working directory (fallback for dev mode if not next to script).
+    Priority when running as a bundled app (e.g., PyInstaller):
+    1. External file next to the executable (lets the user override the bundled theme).
+    2. Bundled file.
+    Priority when running as a script:
+    1. File next to the script.
+    2. File in the current working directory (fallback if run from a different CWD).
     Returns the path to the theme file, or None if not found.
     """
-    # Check for external file next to the executable or script
-    if getattr(sys, 'frozen', False):  # Running as a bundled app (e.g., PyInstaller)
-        application_path = os.path.dirname(sys.executable)
+    if getattr(sys, 'frozen', False):  # Running as a bundled app; the CWD is never consulted
+        candidates = [("external", os.path.join(os.path.dirname(sys.executable), filename))]
+        bundle_path = getattr(sys, '_MEIPASS', None) # PyInstaller creates a temp folder and stores path in _MEIPASS
+        if bundle_path:
+            candidates.append(("bundled", os.path.join(bundle_path, filename)))
     else:  # Running as a script
         try:
             application_path = os.path.dirname(os.path.abspath(__file__))
         except NameError: # __file__ is not defined (e.g. in interactive interpreter)
             application_path = os.path.abspath(".")
+        candidates = [("external", os.path.join(application_path, filename))]
+        dev_cwd_path = os.path.join(os.path.abspath("."), filename)
+        if dev_cwd_path != candidates[0][1]: # Avoid re-checking same path
+            candidates.append(("CWD (dev fallback)", dev_cwd_path))
 
-    external_theme_path = os.path.join(application_path, filename)
-    if os.path.exists(external_theme_path):
-        print(f"INFO: Using external theme: {external_theme_path}")
-        return external_theme_path
-
-    # If not found externally, try to find the bundled version (PyInstaller)
-    try:
-        base_path = sys._MEIPASS # PyInstaller creates a temp folder and stores path in _MEIPASS
-        bundled_theme_path = os.path.join(base_path, filename)
-        if os.path.exists(bundled_theme_path):
-            print(f"INFO: Using bundled theme: {bundled_theme_path}")
-            return bundled_theme_path
-    except Exception:
-        # _MEIPASS not defined, not running bundled or error accessing it
-        pass
-
-    # Fallback for development if still not found (e.g. if script is run from a different CWD)
-    dev_cwd_path = os.path.join(os.path.abspath("."), filename)
-    if os.path.exists(dev_cwd_path) and dev_cwd_path != external_theme_path: # Avoid re-checking same path
-        print(f"INFO: Using theme from CWD (dev fallback): {dev_cwd_path}")
-        return dev_cwd_path
+    for source, theme_path in candidates:
+        if os.path.exists(theme_path):
+            print(f"INFO: Using {source} theme: {theme_path}")
+            return theme_path
 
     print(f"WARNING: Theme file '{filename}' not found. Pygame_GUI will use its default theme.")
     return None
-# --- End Helper function ---
+
+@functools.lru_cache(maxsize=64)
+def get_sysfont(font_name, size):
+    """
+    Returns pygame.font.SysFont(font_name, size), memoized so repeated lookups
+    (font re-init, every tile-number font size) don't rescan the system font list.
+    """
+    return pygame.font.SysFont(font_name, size)
+# --- End Helper functions ---
 
 # --- Configuration ---
 TILESET_WIDTH = 2048
@@ -75,8 +79,14 @@ COLS = TILESET_WIDTH // TILE_SIZE
 ROWS = TILESET_HEIGHT // TILE_SIZE
 TOTAL_TILES = COLS * ROWS
 CONFIG_FILE_NAME = "tilescope_config.ini"
-MAX_SURFACE_DIM = 8192
 GUIDE_FILE_NAME = "CONFIGURATION_GUIDE.md" # For user reference
+TEMP_MESSAGE_DURATION_MS = 2500 # How long show_temp_message text stays on screen
+SCALED_VIEW_CACHE_SIZE = 8 # Recently scaled views kept for reuse during wheel/drag bursts
+HAS_FBLITS = hasattr(pygame.Surface, "fblits") # pygame-ce only; upstream pygame falls back to Surface.blits
+HAS_SCRAP_TEXT = hasattr(pygame.scrap, "put_text") # pygame-ce only; upstream pygame falls back to the Tk clipboard
+TWO_DIGIT_LABELS = tuple(f"{i:02d}" for i in range(100)) # "00".."99", indexed by the last two digits of a tile ID
+
+COLOR_TUPLE_RE = re.compile(r'\(\s*\d+\s*(?:,\s*\d+\s*)+\)') # "(R, G, B)" or "(R, G, B, A)" inside an INI value
 
 # Determine the theme file path using the new function
 ACTUAL_THEME_FILE_PATH = get_theme_file_path("theme.json")
@@ -121,6 +131,9 @@ DEFAULT_INI_STRUCTURE = {
         "theme_file_name": "theme.json    ; Name of the UI theme file (user can place this next to exe to override bundled theme)"
     }
 }
+# Inline comment of every default (from " ; " on, or ""), split once so saving never scans the defaults
+DEFAULT_INI_COMMENTS = {(section, key): (value[value.find(" ; "):] if " ; " in value else "")
+                        for section, options in DEFAULT_INI_STRUCTURE.items() for key, value in options.items()}
 # --- End Configuration ---
 
 class TileScope:
@@ -133,6 +146,7 @@ class TileScope:
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
 
         self.settings_raw = {} # Will hold raw string values from INI
+        self._setting_cache = {} # Parsed _get_setting results, keyed by (section, key, expected_type)
         self.load_settings_from_ini()
 
         # Initialize UIManager with the dynamically found theme path.
@@ -142,14 +156,27 @@ class TileScope:
         # The UIManager constructor handles theme loading if theme_path is provided.
         # If a theme was specified but failed to load, a warning would have been printed by get_theme_file_path
         # or by Pygame GUI itself.
+        self._cache_theme_colors()
 
         self.ui_font = pygame.font.SysFont("Arial", 18)
 
+        self.scaled_view_cache = {} # (mip level, source rect, scaled size) -> scaled surface, oldest first
         self.base_tileset_image = self.create_base_tileset_image(input_path)
         self.scaled_tileset_image = None
+        self.visible_view_key = None
+        self.visible_view_range = (0, 0, 0, 0)
+        self.cached_grid_numbers_overlay = None
+        self.grid_numbers_overlay_dirty = True
+        self.cached_grid_overlay = None
+        self.grid_overlay_key = None # (zoom, window size, grid color) the cached grid was drawn for
+        # Tileset, background overlay, grid and numbers flattened into one opaque surface for the visible view
+        self.cached_static_view = None
+        self.static_view_dirty = True
 
         self.zoom = 1.0
         self.actual_applied_zoom = 1.0
+        self.tile_edge_px = [] # Filled in by update_scaled_tileset_and_overlays
+        self.tiles_per_screen_px = 1.0 / TILE_SIZE # Reciprocal of the on-screen tile size, for get_visible_tile_range
         self.min_zoom = 0.05
         self.max_zoom = 4.0
 
@@ -157,39 +184,56 @@ class TileScope:
         self.offset_y = 0.0
         self.dragging = False
         self.last_mouse_pos = (0, 0)
+        self.drag_dx = 0 # Drag motion not yet applied to the offset
+        self.drag_dy = 0
+        self.pending_resize = None # Latest window size from VIDEORESIZE not yet applied
 
         self.hover_col = None
         self.hover_row = None
-        self.selected_tiles = set()
-
-        self.show_grid = self._get_setting("Toggles", "show_grid_default", bool, True)
-        self.show_numbers = self._get_setting("Toggles", "show_numbers_default", bool, True)
-        self.show_background_overlay = self._get_setting("Toggles", "show_background_overlay_default", bool, True)
+        self.pending_mouse_pos = None # Last motion position not yet hit-tested
+        self.needs_redraw = True # Set by events; run() skips drawing idle frames
+        self.tk_root = None # Hidden Tk root for dialogs and clipboard, see _get_tk_root
+        # Tile IDs never change, so the ID and two-digit label of every cell (row * COLS + col) are built once
+        self.tile_id_grid = self.compute_tile_ids_grid() # [row, col] -> tile ID
+        self.tile_ids = tuple(self.tile_id_grid.ravel().tolist())
+        self.tile_label_nums = tuple((self.tile_id_grid.ravel() % 100).tolist()) # Index into TWO_DIGIT_LABELS and label surfaces
+        # Inverse table, tile ID -> (col, row), derived from compute_tile_id so it follows any change to the ID scheme
+        self.tile_cells = [None] * TOTAL_TILES
+        for cell_idx, tile_id in enumerate(self.tile_ids):
+            row, col = divmod(cell_idx, COLS)
+            self.tile_cells[tile_id] = (col, row)
+
+        # Selection mask indexed by tile ID, plus a running count of selected tiles
+        self.selected_mask = np.zeros(TOTAL_TILES, dtype=bool)
+        self.selected_count = 0
+        # show_grid, show_numbers and show_background_overlay start from the defaults set by load_settings_from_ini
 
         self.export_requested = False
         self.show_export_progress = False
         self.export_progress = 0
+        self.export_thread = None # Worker compositing and saving the current export
+        self.export_results = queue.Queue() # (message, level, new cache entry or None) from the worker
+        self.cached_export = None # (export key, composited surface) of the last export, see export_tileset_image
 
         self.temp_message = None
         self.temp_message_time = 0
         self.show_ui_panel_flag = True
 
         self.tile_number_reference_font = None
-        self.pre_rendered_tile_numbers = {}
-        self.cached_fonts = {}
-        self.cached_rendered_numbers = {}
+        self.pre_rendered_tile_numbers = [] # Indexed by label number (tile ID % 100)
+        self.number_atlas = [] # Label number -> (surface, half width, half height) at number_atlas_size
+        self.number_atlas_size = None
 
-        self.base_hover_surface = None
-        self.base_select_surface = None
-        self.cached_scaled_hover_surface = None
-        self.cached_scaled_select_surface = None
-        self.cached_actual_zoom_for_overlays = -1.0
+        self.hover_highlight_surface = None
+        self.select_highlight_surface = None
+        self.highlight_surface_px = 0 # Edge length of the highlight surfaces, the current on-screen tile size
 
-        self.tileset_area_overlay_surface = None
+        self.dimmed_mip_levels = {} # Mip level -> copy with the background overlay blended in, see _get_dimmed_level
 
         self.ui_panel = None
         self.ui_panel_rect = pygame.Rect(0,0,0,0)
         self.buttons = {}
+        self.button_actions = {} # UIButton -> action, filled in by setup_ui_elements
         self.button_configs = {
             "row1": [
                 ("open", "Open Image", self.open_image_dialog, False),
@@ -210,27 +254,44 @@ class TileScope:
         self._update_font_and_pre_render_numbers()
         self._update_base_overlay_surfaces()
         self.setup_ui_elements()
+        self._update_panel_state()
         self.update_scaled_tileset_and_overlays()
         self.clamp_offset()
         self.clock = pygame.time.Clock()
 
     def _parse_color_tuple_from_string(self, s_tuple_str, default_color=(0,0,0,0)):
-        try:
-            evaluated = ast.literal_eval(s_tuple_str.strip())
-            if isinstance(evaluated, tuple) and (3 <= len(evaluated) <= 4) and all(isinstance(x, int) for x in evaluated):
-                return evaluated
-        except (ValueError, SyntaxError, TypeError):
-            pass
+        # The regex only matches "(" integers separated by commas ")", so the numbers can be split out
+        # directly; out-of-range channels fall back to the default instead of failing later in fill()
+        match = COLOR_TUPLE_RE.search(s_tuple_str)
+        if not match:
+            return default_color
+        channels = tuple(int(part) for part in match.group(0)[1:-1].split(','))
+        if 3 <= len(channels) <= 4 and all(0 <= channel <= 255 for channel in channels):
+            return channels
         return default_color
 
     def _get_setting(self, section, key, expected_type, default_value):
+        cache_key = (section, key, expected_type)
+        if cache_key in self._setting_cache:
+            return self._setting_cache[cache_key]
+        value = self._parse_setting(section, key, expected_type, default_value)
+        self._setting_cache[cache_key] = value
+        return value
+
+    def _set_setting_raw(self, section, key, str_val):
+        self.settings_raw.setdefault(section, {})[key] = str_val
+        self.settings_dirty = True
+        # Drop only the parsed values of this option; everything else stays cached
+        for cache_key in [k for k in self._setting_cache if k[0] == section and k[1] == key]:
+            del self._setting_cache[cache_key]
+
+    def _parse_setting(self, section, key, expected_type, default_value):
         str_val = self.settings_raw.get(section, {}).get(key)
 
         if str_val is None:
             return default_value
 
-        str_val = str_val.split(';')[0].strip() # Remove comments
-        str_val = str_val.split('#')[0].strip() # Remove comments
+        str_val = str_val.partition(';')[0].partition('#')[0].strip() # Remove comments
 
         if expected_type == bool:
             return str_val.lower() == 'true'
@@ -246,63 +307,75 @@ class TileScope:
             return str_val
         return default_value
 
+    def _read_ini_file(self, path):
+        # Minimal reader for our known-schema INI: [section] headers and "key = value" lines,
+        # with full-line comments skipped. Values are kept raw, inline comments included, as ConfigParser
+        # kept them, so a save writes them back unchanged; _parse_setting strips the comment when reading.
+        # Much cheaper than a ConfigParser round trip.
+        sections = {}
+        current_section = None
+        with open(path, 'r') as ini_file:
+            for line in ini_file:
+                line = line.strip()
+                if not line or line[0] in ';#': continue # Blank line or comment
+                if line[0] == '[' and line[-1] == ']':
+                    current_section = sections.setdefault(line[1:-1].strip(), {})
+                    continue
+                if current_section is None or '=' not in line: continue
+                key, _, value = line.partition('=')
+                # Keys are case-insensitive, as with ConfigParser
+                current_section[key.strip().lower()] = value.strip()
+        return sections
+
+    def _write_ini_file(self, path, sections):
+        # Counterpart of _read_ini_file, producing the same layout ConfigParser.write did:
+        # a [section] header, "key = value" lines and a blank line after each section
+        lines = []
+        for section_name, section_options in sections.items():
+            lines.append(f"[{section_name}]\n")
+            lines.extend(f"{key} = {value}\n" for key, value in section_options.items())
+            lines.append("\n")
+        with open(path, 'w') as ini_file:
+            ini_file.write("".join(lines))
+
     def load_settings_from_ini(self):
         self.settings_raw = {} # Holds raw string values from INI
-
-        # Prepare a ConfigParser object with all default structure and values
-        config_to_write = configparser.ConfigParser(inline_comment_prefixes=(';', '#'), allow_no_value=True)
+        self._setting_cache = {}
+
+        values_from_file = {}
+        file_existed = True
+        try: # Opening directly instead of checking os.path.exists first saves a stat on every load
+            values_from_file = self._read_ini_file(CONFIG_FILE_NAME)
+        except FileNotFoundError:
+            file_existed = False
+        except (IOError, UnicodeDecodeError) as e:
+            print(f"Warning: Could not read config file '{CONFIG_FILE_NAME}': {e}. Using defaults.")
+
+        # Merge file values over the defaults; only keys we know are kept
+        keys_added = False
         for section_name, section_options in DEFAULT_INI_STRUCTURE.items():
-            if not config_to_write.has_section(section_name):
-                config_to_write.add_section(section_name)
+            section_from_file = values_from_file.get(section_name, {})
+            self.settings_raw[section_name] = {}
             for key, full_default_value in section_options.items():
-                config_to_write.set(section_name, key, full_default_value)
+                if key in section_from_file:
+                    self.settings_raw[section_name][key] = section_from_file[key]
+                else:
+                    self.settings_raw[section_name][key] = full_default_value # _get_setting strips the comment
+                    keys_added = True
 
-        file_existed = os.path.exists(CONFIG_FILE_NAME)
-        if file_existed:
-            # If file exists, read it and update our config_to_write with values from the file
-            config_from_file = configparser.ConfigParser(inline_comment_prefixes=(';', '#'), allow_no_value=True)
+        # Only write the file when it is missing or lacks options, so new options get added with their
+        # comments while an up-to-date file is left untouched
+        if keys_added:
             try:
-                if config_from_file.read(CONFIG_FILE_NAME):
-                    for section in config_from_file.sections():
-                        if section in DEFAULT_INI_STRUCTURE: # Only process sections we know
-                            for key, value_from_file in config_from_file.items(section):
-                                if key in DEFAULT_INI_STRUCTURE[section]: # Only process keys we know
-                                    # Preserve user's value if it's not just a structural comment
-                                    default_value_in_structure = DEFAULT_INI_STRUCTURE[section][key]
-                                    is_default_structural = default_value_in_structure.strip().startswith(';') or \
-                                                       default_value_in_structure.strip().startswith('#') or \
-                                                       default_value_in_structure.strip() == ""
-                                    if not is_default_structural or value_from_file.strip():
-                                        config_to_write.set(section, key, value_from_file)
-            except configparser.Error as e:
-                print(f"Warning: Error parsing config file '{CONFIG_FILE_NAME}': {e}. Defaults may be re-applied.")
-
-        # Write the (potentially updated) config back to the file.
-        # This ensures new options are added and comments are preserved/updated.
-        try:
-            with open(CONFIG_FILE_NAME, 'w') as configfile:
-                config_to_write.write(configfile)
-            if not file_existed:
-                print(f"Info: Created new config file '{CONFIG_FILE_NAME}' with defaults.")
-        except IOError:
-            print(f"Error: Could not write config file to '{CONFIG_FILE_NAME}'. Using defaults.")
-
-        # Now, read the INI file for runtime use into self.settings_raw
-        runtime_config = configparser.ConfigParser(inline_comment_prefixes=(';', '#'), allow_no_value=True)
-        if runtime_config.read(CONFIG_FILE_NAME):
-            for section_default, options_default in DEFAULT_INI_STRUCTURE.items():
-                self.settings_raw[section_default] = {}
-                for key_default, default_val_str in options_default.items():
-                    if runtime_config.has_option(section_default, key_default):
-                        self.settings_raw[section_default][key_default] = runtime_config.get(section_default, key_default)
-                    else:
-                        # This case should be rare if writing logic above is correct, but good for robustness
-                        self.settings_raw[section_default][key_default] = default_val_str
-        else:
-            # Fallback if reading fails (e.g., permissions issue after write)
-            print(f"Warning: Could not read '{CONFIG_FILE_NAME}' for runtime. Using hardcoded defaults for self.settings_raw.")
-            for section_default, options_default in DEFAULT_INI_STRUCTURE.items():
-                self.settings_raw[section_default] = dict(options_default) # Use a copy
+                self._write_ini_file(CONFIG_FILE_NAME, self.settings_raw)
+                if not file_existed:
+                    print(f"Info: Created new config file '{CONFIG_FILE_NAME}' with defaults.")
+            except IOError:
+                print(f"Error: Could not write config file to '{CONFIG_FILE_NAME}'. Using defaults.")
+
+        self.settings_dirty = False # Nothing to save until a setting is changed at runtime
+
+        self._cache_draw_settings()
 
         # Initialize toggle states from loaded settings
         self.show_grid = self._get_setting("Toggles", "show_grid_default", bool, True)
@@ -314,67 +387,96 @@ class TileScope:
             self._update_base_overlay_surfaces()
 
 
+    def _cache_draw_settings(self):
+        # Settings read while drawing or rebuilding cached surfaces, resolved once per settings load
+        self.bg_color = self._get_setting("DisplayColors", "background", tuple, (25,30,40))
+        self.grid_color = self._get_setting("DisplayColors", "grid_color", tuple, (60,70,90))
+        self.overlay_color = self._get_setting("DisplayColors", "overlay_color", tuple, (0,0,0,70))
+        self.hover_color = self._get_setting("HighlightColors", "tile_hover", tuple, (255,215,0,128))
+        self.select_color = self._get_setting("HighlightColors", "tile_select", tuple, (50,200,50,128))
+        self.tooltip_bg_color = self._get_setting("TooltipAppearance", "tooltip_background", tuple, (20,20,30,220))
+        self.tooltip_border_color = self._get_setting("TooltipAppearance", "tooltip_border", tuple, (70,130,180))
+        self.tooltip_text_color = self._get_setting("TextColors", "tooltip_text", tuple, (230,230,230))
+        self.tooltip_cache = None # (col, row, tooltip box) drawn with the colors above, see draw_tooltip
+        self.tile_number_text_color = self._get_setting("TextColors", "tile_number_text", tuple, (220,220,220))
+        self.tile_number_font_name = self._get_setting("FontSettings", "tile_number_font_name", str, "Arial")
+        self.tile_number_font_aa = self._get_setting("FontSettings", "tile_number_font_aa", bool, True)
+        self.tile_number_ref_size = self._get_setting("FontSettings", "tile_number_reference_font_size", int, 10)
+
     def save_settings_to_ini(self):
-        config = configparser.ConfigParser(inline_comment_prefixes=(';', '#'), allow_no_value=True)
+        if not self.settings_dirty: return # File already matches what was loaded or last saved
+        settings_to_write = {}
+        # Toggle defaults are written from the current state, with the comment of the default value
+        toggle_states = {"show_background_overlay_default": self.show_background_overlay,
+                         "show_grid_default": self.show_grid,
+                         "show_numbers_default": self.show_numbers}
 
         for section, options in DEFAULT_INI_STRUCTURE.items():
-            if not config.has_section(section):
-                config.add_section(section)
+            section_to_write = settings_to_write[section] = {}
+            section_raw = self.settings_raw.get(section, {})
             for key, default_str_val_with_comment in options.items():
-                # Get the current raw string value to write, falling back to default if not set
-                current_val_to_write = self.settings_raw.get(section, {}).get(key, default_str_val_with_comment)
-
-                # Special handling for toggle defaults to reflect current state
-                if section == "Toggles":
-                    original_comment_part = ""
-                    comment_marker = " ; " # Assuming space-semicolon-space for comments
-                    if comment_marker in default_str_val_with_comment:
-                        original_comment_part = default_str_val_with_comment[default_str_val_with_comment.find(comment_marker):]
-
-                    if key == "show_background_overlay_default":
-                        current_val_to_write = ("true" if self.show_background_overlay else "false") + original_comment_part
-                    elif key == "show_grid_default":
-                        current_val_to_write = ("true" if self.show_grid else "false") + original_comment_part
-                    elif key == "show_numbers_default":
-                        current_val_to_write = ("true" if self.show_numbers else "false") + original_comment_part
-                
-                config.set(section, key, current_val_to_write)
+                if section == "Toggles" and key in toggle_states:
+                    current_val_to_write = ("true" if toggle_states[key] else "false") + DEFAULT_INI_COMMENTS[(section, key)]
+                else: # Current raw string value, falling back to the default if not set
+                    current_val_to_write = section_raw.get(key, default_str_val_with_comment)
+                section_to_write[key] = current_val_to_write
         try:
-            with open(CONFIG_FILE_NAME, 'w') as configfile:
-                config.write(configfile)
+            self._write_ini_file(CONFIG_FILE_NAME, settings_to_write)
+            self.settings_dirty = False
         except IOError:
             print(f"Error: Could not save settings to '{CONFIG_FILE_NAME}'.")
 
     def _update_font_and_pre_render_numbers(self):
-        font_name = self._get_setting("FontSettings", "tile_number_font_name", str, "Arial")
-        ref_size = self._get_setting("FontSettings", "tile_number_reference_font_size", int, 10)
-        font_aa = self._get_setting("FontSettings", "tile_number_font_aa", bool, True)
+        font_name = self.tile_number_font_name
+        ref_size = self.tile_number_ref_size
         font_aa_export = True # Always use AA for export for quality
 
         try:
-            self.tile_number_reference_font = pygame.font.SysFont(font_name, ref_size)
+            self.tile_number_reference_font = get_sysfont(font_name, ref_size)
         except pygame.error:
             print(f"Warning: Font '{font_name}' (ref size {ref_size}) not found. Using default Arial.")
-            self.tile_number_reference_font = pygame.font.SysFont("Arial", ref_size)
+            self.tile_number_reference_font = get_sysfont("Arial", ref_size)
 
-        text_color_numbers = self._get_setting("TextColors", "tile_number_text", tuple, (220,220,220))
-        self.pre_rendered_tile_numbers.clear()
-        for i in range(100): # Pre-render 00-99 for tile ID display
-            label_str = f"{i:02d}"
-            text_surface = self.tile_number_reference_font.render(label_str, font_aa_export, text_color_numbers)
-            self.pre_rendered_tile_numbers[label_str] = text_surface
+        text_color_numbers = self.tile_number_text_color
+        # Pre-render 00-99 for tile ID display
+        self.pre_rendered_tile_numbers = [self.tile_number_reference_font.render(label_str, font_aa_export, text_color_numbers).convert_alpha()
+                                          for label_str in TWO_DIGIT_LABELS]
 
-        self.cached_fonts.clear()
-        self.cached_rendered_numbers.clear()
+        self.number_atlas_size = None # Font or color may have changed, re-render on next bake
+        self.grid_numbers_overlay_dirty = True
 
     def _update_base_overlay_surfaces(self):
-        self.base_hover_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        self.base_hover_surface.fill(self._get_setting("HighlightColors", "tile_hover", tuple, (255,215,0,128)))
-
-        self.base_select_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        self.base_select_surface.fill(self._get_setting("HighlightColors", "tile_select", tuple, (50,200,50,128)))
-
-        self.cached_actual_zoom_for_overlays = -1.0 # Force recache of scaled overlays
+        # Colors may have changed, drop the flat-color surfaces so they are refilled on next use
+        self.static_view_dirty = True
+        self.hover_highlight_surface = None
+        self.select_highlight_surface = None
+        self.highlight_surface_px = 0
+        self._ensure_highlight_surfaces(round(TILE_SIZE * self.actual_applied_zoom))
+
+    def _ensure_highlight_surfaces(self, tile_px):
+        # Hover and select highlights are flat translucent squares, so one surface per color is filled
+        # directly at exactly the on-screen tile size; nothing is ever scaled. Being exactly one tile,
+        # they need no blit area, which lets the selection go through fblits.
+        if tile_px == self.highlight_surface_px: return
+        size = (tile_px, tile_px)
+        self.hover_highlight_surface = self._make_highlight_surface(size, self.hover_color)
+        self.select_highlight_surface = self._make_highlight_surface(size, self.select_color)
+        self.highlight_surface_px = tile_px
+
+    def _make_highlight_surface(self, size, color):
+        # Stored with premultiplied alpha so every highlight blit can use SDL's cheaper BLEND_PREMULTIPLIED
+        # path instead of the straight alpha blend
+        surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        surface.fill(color)
+        return surface.premul_alpha()
+
+    def _update_panel_state(self):
+        # Whether the UI panel is on screen, its height and the bottom edge of the tileset viewing area,
+        # shared by drawing, hit testing, centering and clamping. These only change when the panel is
+        # built, the window is resized or the panel is shown/hidden, so they are recomputed there.
+        self.ui_panel_visible = bool(self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive())
+        self.visible_panel_height = self.ui_panel_rect.height if self.ui_panel_visible else 0
+        self.view_bottom = self.screen_height - self.visible_panel_height
 
     def setup_ui_elements(self):
         panel_height = 85
@@ -382,9 +484,15 @@ class TileScope:
                                          self.screen_width, panel_height)
 
         if self.ui_panel and self.ui_panel.alive():
-            self.ui_panel.kill()
+            # Buttons are positioned relative to the panel, so on resize moving and stretching
+            # the existing panel is enough; no need to kill and recreate every element
+            self.ui_panel.set_relative_position(self.ui_panel_rect.topleft)
+            self.ui_panel.set_dimensions(self.ui_panel_rect.size)
+            return
+
         self.ui_panel = None
         self.buttons = {}
+        self.button_actions = {}
 
         btn_w, btn_h = 130, 30
         spacing = 10
@@ -407,24 +515,26 @@ class TileScope:
 
         if self.ui_panel and self.ui_panel.alive():
             current_x_rel = panel_internal_padding_x
-            for key, text, _, is_selected_initially in self.button_configs["row1"]:
+            for key, text, action_func, is_selected_initially in self.button_configs["row1"]:
                 btn_rect = pygame.Rect(current_x_rel, row1_y_rel, btn_w, btn_h)
                 button = pygame_gui.elements.UIButton(
                     relative_rect=btn_rect, text=text, manager=self.ui_manager,
                     container=self.ui_panel, object_id=f"#{key}_button"
                 )
                 self.buttons[key] = button
+                self.button_actions[button] = action_func
                 if is_selected_initially: button.select()
                 current_x_rel += btn_w + spacing
 
             current_x_rel = panel_internal_padding_x
-            for key, text, _, is_selected_initially in self.button_configs["row2"]:
+            for key, text, action_func, is_selected_initially in self.button_configs["row2"]:
                 btn_rect = pygame.Rect(current_x_rel, row2_y_rel, btn_w, btn_h)
                 button = pygame_gui.elements.UIButton(
                     relative_rect=btn_rect, text=text, manager=self.ui_manager,
                     container=self.ui_panel, object_id=f"#{key}_button"
                 )
                 self.buttons[key] = button
+                self.button_actions[button] = action_func
                 if is_selected_initially: button.select()
                 current_x_rel += btn_w + spacing
         
@@ -434,13 +544,18 @@ class TileScope:
                 self.ui_panel.hide()
 
     def create_base_tileset_image(self, input_path=None):
-        surface = pygame.Surface((TILESET_WIDTH, TILESET_HEIGHT))
+        # Match the display pixel format up front so scaling and blitting skip per-pixel conversion
+        surface = pygame.Surface((TILESET_WIDTH, TILESET_HEIGHT)).convert()
         if input_path and os.path.exists(input_path):
             try:
                 img = pygame.image.load(input_path)
                 if img.get_size() != (TILESET_WIDTH, TILESET_HEIGHT):
                     self.show_temp_message(f"Warning: Image resized to {TILESET_WIDTH}x{TILESET_HEIGHT}", "warning")
+                    # Convert before scaling so the scaler works in display format
+                    img = img.convert_alpha() if img.get_flags() & pygame.SRCALPHA else img.convert()
                     img = pygame.transform.scale(img, (TILESET_WIDTH, TILESET_HEIGHT))
+                # The blit onto the display-format base is the one and only pixel format conversion;
+                # every later scale and blit works from this converted surface
                 surface.blit(img, (0, 0))
             except pygame.error as e:
                 print(f"Error loading image '{input_path}': {e}")
@@ -450,74 +565,242 @@ class TileScope:
             if input_path: # Only show "not found" if a path was actually given
                 self.show_temp_message(f"File not found: {os.path.basename(input_path)}", "error")
             self.create_placeholder_gradient(surface)
+        self.mip_levels = [surface] # Halved levels are only built on the first zoom-out, see _get_mip_level
+        self.scaled_view_cache.clear() # Scaled views of the previous image are stale
+        self.dimmed_mip_levels = {}
+        self.cached_export = None # Would otherwise keep the previous image and its export alive
+        self.visible_view_key = None # Force the viewport-clipped surfaces to be rebuilt on the next draw
         return surface
 
+    def _get_mip_level(self, level):
+        # Halve the image until a tile is a single pixel, so zoomed-out views scale from a
+        # pre-filtered source close to the target size instead of the full-resolution base.
+        # Levels are added on demand and kept until the base image changes; returns the deepest
+        # level available at or above the one asked for.
+        mip_levels = self.mip_levels
+        while len(mip_levels) <= level and (TILE_SIZE >> len(mip_levels)) > 0 and mip_levels[-1].get_width() > 64:
+            prev = mip_levels[-1]
+            mip_levels.append(pygame.transform.smoothscale(prev, (prev.get_width() // 2, prev.get_height() // 2)))
+        level = min(level, len(mip_levels) - 1)
+        return level, mip_levels[level]
+
     def create_placeholder_gradient(self, surface):
-        # Simple gradient for placeholder
-        for y in range(TILESET_HEIGHT):
-            color_val = int(200 + 55 * y / TILESET_HEIGHT) # Light gray gradient
-            pygame.draw.line(surface, (color_val, color_val, color_val), (0, y), (TILESET_WIDTH, y))
+        # Simple light gray vertical gradient for placeholder, written in one vectorized pass
+        # Integer ramp: same truncated values as the float formula, without a float64 temporary
+        row_values = (200 + 55 * np.arange(TILESET_HEIGHT) // TILESET_HEIGHT).astype(np.uint8)
+        pixels = pygame.surfarray.pixels3d(surface) # Indexed [x, y, channel]
+        pixels[:, :, :] = row_values[np.newaxis, :, np.newaxis]
+        del pixels # Release the surface lock
 
     def update_scaled_tileset_and_overlays(self):
-        # Calculate conceptual dimensions based on zoom
-        conceptual_w = TILESET_WIDTH * self.zoom
-        conceptual_h = TILESET_HEIGHT * self.zoom
-        current_aspect_ratio = TILESET_WIDTH / TILESET_HEIGHT if TILESET_HEIGHT > 0 else 1.0
-
-        # Clamp scaled dimensions to Pygame's max surface dimension
-        if conceptual_w > MAX_SURFACE_DIM:
-            final_scaled_w = MAX_SURFACE_DIM
-            final_scaled_h = MAX_SURFACE_DIM / current_aspect_ratio if current_aspect_ratio > 0 else MAX_SURFACE_DIM
-        elif conceptual_h > MAX_SURFACE_DIM:
-            final_scaled_h = MAX_SURFACE_DIM
-            final_scaled_w = MAX_SURFACE_DIM * current_aspect_ratio
-        else:
-            final_scaled_w = conceptual_w
-            final_scaled_h = conceptual_h
+        # The scaled tileset only ever covers the visible part of the base image (see _update_visible_tileset_view),
+        # so its size is bounded by the screen and needs no clamping against a maximum surface size.
+        # Everything derived here depends on the zoom alone; the visible view itself is keyed on zoom and tile
+        # range, so resizes and resets that keep the zoom skip the work.
+        if self.zoom == self.actual_applied_zoom and self.tile_edge_px: return
+        self.actual_applied_zoom = self.zoom
+        # Whole-pixel offset of every tile edge from the tileset origin, for integer-only hit testing
+        on_screen_tile_size = TILE_SIZE * self.actual_applied_zoom
+        self.tiles_per_screen_px = 1.0 / on_screen_tile_size if on_screen_tile_size > 1e-6 else 1.0 / TILE_SIZE
+        self.tile_edge_px = [round(i * on_screen_tile_size) for i in range(max(COLS, ROWS) + 1)]
 
-        final_scaled_w = max(1, int(final_scaled_w)) # Ensure at least 1x1
-        final_scaled_h = max(1, int(final_scaled_h))
+        # Highlight surfaces only need to be at least one tile large
+        self._ensure_highlight_surfaces(round(on_screen_tile_size))
+
+    def _update_visible_tileset_view(self):
+        start_col, end_col, start_row, end_row = self.get_visible_tile_range()
+        view_key = (self.actual_applied_zoom, start_col, end_col, start_row, end_row)
+        if view_key == self.visible_view_key: return # Same tiles visible at the same zoom, reuse surfaces
+        self.visible_view_key = view_key
+        self.visible_view_range = (start_col, end_col, start_row, end_row)
+        self.grid_numbers_overlay_dirty = True
+
+        if start_col >= end_col or start_row >= end_row: # Tileset is entirely off screen
+            self.scaled_tileset_image = None
+            return
+
+        # Clip to whole tiles so the scaled sub-image lines up with the grid
+        on_screen_tile_size = TILE_SIZE * self.actual_applied_zoom
+        base_rect = pygame.Rect(start_col * TILE_SIZE, start_row * TILE_SIZE,
+                                (end_col - start_col) * TILE_SIZE, (end_row - start_row) * TILE_SIZE)
+        scaled_w = max(1, round((end_col - start_col) * on_screen_tile_size)) # Ensure at least 1x1
+        scaled_h = max(1, round((end_row - start_row) * on_screen_tile_size))
 
         if self.base_tileset_image.get_width() > 0 and self.base_tileset_image.get_height() > 0:
-            self.scaled_tileset_image = pygame.transform.scale(self.base_tileset_image, (final_scaled_w, final_scaled_h))
+            # When zoomed out, scale from the closest mip level instead of the full-resolution base
+            level, mip_surface = 0, self.base_tileset_image
+            if self.actual_applied_zoom < 1.0:
+                level, mip_surface = self._get_mip_level(int(math.floor(-math.log2(self.actual_applied_zoom))))
+            mip_rect = pygame.Rect(base_rect.x >> level, base_rect.y >> level, base_rect.w >> level, base_rect.h >> level)
+            dimmed = self.show_background_overlay
+            if dimmed: mip_surface = self._get_dimmed_level(level, mip_surface)
+            # Zoom nudges and panning back and forth often ask for a view that was just scaled
+            scale_key = (level, dimmed, tuple(mip_rect), scaled_w, scaled_h)
+            scaled_view = self.scaled_view_cache.get(scale_key)
+            if scaled_view is None:
+                source_view = mip_surface.subsurface(mip_rect)
+                if source_view.get_size() == (scaled_w, scaled_h):
+                    # Zoom is an exact power of two (1x, 0.5x, 0.25x...): the mip level already has the
+                    # right size, so the view is used as-is without resampling a single pixel
+                    scaled_view = source_view
+                else:
+                    # Nearest-neighbour keeps pixel art sharp; upscales read the full-resolution base and
+                    # downscales a pre-filtered mip level, so neither aliases nor reads excess pixels.
+                    # Mip levels are already in display format, so the scaled copy inherits it.
+                    scaled_view = pygame.transform.scale(source_view, (scaled_w, scaled_h))
+                self.scaled_view_cache[scale_key] = scaled_view
+                if len(self.scaled_view_cache) > SCALED_VIEW_CACHE_SIZE: # Evict the oldest entry
+                    del self.scaled_view_cache[next(iter(self.scaled_view_cache))]
+            self.scaled_tileset_image = scaled_view
         else: # Handle case where base image might be invalid
-            self.scaled_tileset_image = pygame.Surface((final_scaled_w, final_scaled_h))
-            self.scaled_tileset_image.fill(self._get_setting("DisplayColors", "background", tuple, (25,30,40)))
-
-        # Calculate the actual zoom applied after clamping
-        self.actual_applied_zoom = final_scaled_w / TILESET_WIDTH if TILESET_WIDTH > 0 else 1.0
-        if TILESET_HEIGHT > 0 and abs(final_scaled_h / TILESET_HEIGHT - self.actual_applied_zoom) > 1e-5 : # Check consistency
-            self.actual_applied_zoom = final_scaled_h / TILESET_HEIGHT # Prioritize height if aspect ratio was forced by MAX_SURFACE_DIM
-
-        # Update tileset area overlay (for background dimming)
-        if self.scaled_tileset_image:
-            overlay_w = self.scaled_tileset_image.get_width()
-            overlay_h = self.scaled_tileset_image.get_height()
-            if overlay_w > 0 and overlay_h > 0:
-                self.tileset_area_overlay_surface = pygame.Surface((overlay_w, overlay_h), pygame.SRCALPHA)
-                self.tileset_area_overlay_surface.fill(self._get_setting("DisplayColors", "overlay_color", tuple, (0,0,0,70)))
-            else: self.tileset_area_overlay_surface = None
-        else: self.tileset_area_overlay_surface = None
-
-        # Cache scaled hover/select surfaces if zoom changed significantly
-        current_on_screen_tile_size = round(TILE_SIZE * self.actual_applied_zoom)
-        if abs(self.actual_applied_zoom - self.cached_actual_zoom_for_overlays) > 1e-6: # If zoom changed
-            if current_on_screen_tile_size < 1: # If tiles are too small, use a tiny transparent surface
-                dummy_surf = pygame.Surface((1,1), pygame.SRCALPHA); dummy_surf.fill((0,0,0,0))
-                self.cached_scaled_hover_surface = dummy_surf
-                self.cached_scaled_select_surface = dummy_surf
-            else:
-                if self.base_hover_surface:
-                    self.cached_scaled_hover_surface = pygame.transform.scale(self.base_hover_surface, (current_on_screen_tile_size, current_on_screen_tile_size))
-                if self.base_select_surface:
-                    self.cached_scaled_select_surface = pygame.transform.scale(self.base_select_surface, (current_on_screen_tile_size, current_on_screen_tile_size))
-            self.cached_actual_zoom_for_overlays = self.actual_applied_zoom
+            self.scaled_tileset_image = pygame.Surface((scaled_w, scaled_h)).convert()
+            self.scaled_tileset_image.fill(self.bg_color)
+
+    def _get_dimmed_level(self, level, mip_surface):
+        # The background overlay is a flat color blended over every pixel, so it is blended into a copy
+        # of the unscaled mip level once and views are scaled from that copy. Nearest-neighbour scaling
+        # picks whole pixels, so this matches blending after scaling, without an overlay blit per view.
+        dimmed = self.dimmed_mip_levels.get(level)
+        if dimmed is None:
+            dimmed = mip_surface.copy()
+            overlay = pygame.Surface(mip_surface.get_size(), pygame.SRCALPHA)
+            overlay.fill(self.overlay_color)
+            dimmed.blit(overlay, (0, 0))
+            self.dimmed_mip_levels[level] = dimmed
+        return dimmed
+
+    def get_visible_view_pos(self):
+        # Screen position of the top-left corner of the viewport-clipped surfaces
+        on_screen_tile_size = TILE_SIZE * self.actual_applied_zoom
+        return (round(self.offset_x + self.visible_view_range[0] * on_screen_tile_size),
+                round(self.offset_y + self.visible_view_range[2] * on_screen_tile_size))
+
+    def _create_grid_overlay(self):
+        # Transparent grid big enough for the largest tile range get_visible_tile_range can return
+        # for this window size and zoom (visible tiles plus its partial-tile buffer)
+        on_screen_tile_size = TILE_SIZE * self.actual_applied_zoom
+        grid_cols = min(COLS, int(self.screen_width / on_screen_tile_size) + 3)
+        grid_rows = min(ROWS, int(self.screen_height / on_screen_tile_size) + 3)
+        grid_w = round(grid_cols * on_screen_tile_size) + 1
+        grid_h = round(grid_rows * on_screen_tile_size) + 1
+        grid_surface = pygame.Surface((grid_w, grid_h), pygame.SRCALPHA).convert_alpha()
+        grid_surface.fill((0,0,0,0))
+        grid_color = self.grid_color
+        # Every 1px line is written in a single array assignment per axis instead of one draw call per line
+        line_xs = np.round(np.arange(grid_cols + 1) * on_screen_tile_size).astype(np.intp)
+        line_ys = np.round(np.arange(grid_rows + 1) * on_screen_tile_size).astype(np.intp)
+        pixels = pygame.surfarray.pixels3d(grid_surface) # Indexed [x, y, channel]
+        pixels[line_xs, :] = grid_color[:3]
+        pixels[:, line_ys] = grid_color[:3]
+        del pixels # Release the surface lock
+        grid_alpha = grid_color[3] if len(grid_color) > 3 else 255
+        if grid_alpha != 0: # fill() above already left every pixel at alpha 0
+            alpha = pygame.surfarray.pixels_alpha(grid_surface)
+            alpha[line_xs, :] = grid_alpha
+            alpha[:, line_ys] = grid_alpha
+            del alpha
+        return grid_surface
+
+    def _update_static_view(self):
+        # Everything under the highlights only changes with the view, zoom, toggles and colors, so it is
+        # composited once into an opaque surface and the frame needs a single plain blit
+        self.static_view_dirty = False
+        if self.grid_numbers_overlay_dirty:
+            self._update_grid_numbers_overlay()
+        if not self.scaled_tileset_image:
+            self.cached_static_view = None
+            return
+
+        view_w, view_h = self.scaled_tileset_image.get_size()
+        grid_numbers_overlay = self.cached_grid_numbers_overlay
+        # The grid overlay is one pixel larger for the closing line on the right/bottom edge
+        size = grid_numbers_overlay.get_size() if grid_numbers_overlay else (view_w, view_h)
+        static_view = self.cached_static_view
+        if static_view is None or static_view.get_size() != size:
+            static_view = pygame.Surface(size).convert()
+        static_view.fill(self.bg_color)
+        static_view.blit(self.scaled_tileset_image, (0, 0)) # Background overlay already blended in, see _get_dimmed_level
+        if grid_numbers_overlay:
+            static_view.blit(grid_numbers_overlay, (0, 0))
+        self.cached_static_view = static_view
+
+    def _update_grid_numbers_overlay(self):
+        # Grid lines and tile numbers only change with the visible tiles, zoom, toggles and font, so they
+        # are baked once into a transparent surface covering the clipped view and blitted every frame
+        self.grid_numbers_overlay_dirty = False
+        self.cached_grid_numbers_overlay = None
+        if not self.scaled_tileset_image or not (self.show_grid or self.show_numbers): return
+
+        start_col, end_col, start_row, end_row = self.visible_view_range
+        on_screen_tile_size = TILE_SIZE * self.actual_applied_zoom
+        on_screen_tile_size_px = round(on_screen_tile_size) # Pixel size for drawing
+        # Zoomed out too far for either grid lines or numbers: skip allocating an empty overlay
+        if on_screen_tile_size_px < 4 and not (self.show_grid and on_screen_tile_size_px > 1): return
+        # One extra pixel so the closing grid line on the right/bottom edge fits
+        overlay_w = self.scaled_tileset_image.get_width() + 1
+        overlay_h = self.scaled_tileset_image.get_height() + 1
+        if self.show_grid and on_screen_tile_size_px > 1: # Only draw grid if tiles are large enough
+            # Grid lines sit at the same offsets in every tile-aligned view, so each view starts from one cached
+            # grid, redrawn only when the zoom, window size or grid color change (a reset or resize back to the
+            # same values reuses it)
+            grid_key = (self.actual_applied_zoom, self.screen_width, self.screen_height, self.grid_color)
+            if grid_key != self.grid_overlay_key:
+                self.cached_grid_overlay = self._create_grid_overlay()
+                self.grid_overlay_key = grid_key
+            overlay = self.cached_grid_overlay.subsurface((0, 0, overlay_w, overlay_h)).copy()
+        else:
+            overlay = pygame.Surface((overlay_w, overlay_h), pygame.SRCALPHA).convert_alpha()
+            overlay.fill((0,0,0,0))
+
+        # Draw Tile Numbers
+        if self.show_numbers and on_screen_tile_size_px >= 4 : # Only draw if enough space
+            base_font_calc_size = int(self.tile_number_ref_size * self.zoom)
+            target_num_font_size = max(4, min(base_font_calc_size, 40)) # Clamp font size
+
+            if target_num_font_size >= 4: # Ensure font is reasonably sized
+                if target_num_font_size != self.number_atlas_size:
+                    self._rebuild_number_atlas(target_num_font_size)
+                number_atlas = self.number_atlas
+                tile_label_nums = self.tile_label_nums
+                # Tile centers in the overlay are the same for every row/column, so they are rounded once
+                # per axis; the visible range is already clamped to the tileset, so no bounds checks
+                col_centers = [(c_idx, round((c_idx - start_col + 0.5) * on_screen_tile_size)) for c_idx in range(start_col, end_col)]
+
+                # Positions grouped per label surface, so consecutive blits reuse the same source
+                # surface, and all numbers go to SDL in a single call
+                number_blits_by_label = {}
+                for r_idx in range(start_row, end_row):
+                    center_y = round((r_idx - start_row + 0.5) * on_screen_tile_size)
+                    row_base = r_idx * COLS
+                    for c_idx, center_x in col_centers:
+                        label_num = tile_label_nums[row_base + c_idx]
+                        final_number_surf, half_w, half_h = number_atlas[label_num]
+                        number_blits_by_label.setdefault(label_num, (final_number_surf, []))[1].append((center_x - half_w, center_y - half_h))
+                number_blits = [(surf, pos) for surf, positions in number_blits_by_label.values() for pos in positions]
+                if HAS_FBLITS: overlay.fblits(number_blits)
+                else: overlay.blits(number_blits, doreturn=False)
+
+        self.cached_grid_numbers_overlay = overlay
+
+    def _rebuild_number_atlas(self, font_size):
+        # All 100 two-digit labels are rendered in one go whenever the zoomed font size changes,
+        # instead of lazily while baking the overlay
+        font_name = self.tile_number_font_name
+        text_color = self.tile_number_text_color
+        font_aa = self.tile_number_font_aa
+        try: current_font = get_sysfont(font_name, font_size)
+        except pygame.error: current_font = get_sysfont("Arial", font_size) # Fallback
+
+        self.number_atlas = []
+        for label_str in TWO_DIGIT_LABELS:
+            number_surf = current_font.render(label_str, font_aa, text_color).convert_alpha()
+            self.number_atlas.append((number_surf, number_surf.get_width() // 2, number_surf.get_height() // 2))
+        self.number_atlas_size = font_size
 
     def clamp_offset(self):
         conceptual_scaled_width = TILESET_WIDTH * self.zoom
         conceptual_scaled_height = TILESET_HEIGHT * self.zoom
-        panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
-        view_height = self.screen_height - panel_height
+        view_height = self.view_bottom
 
         # Center if image is smaller than view
         if conceptual_scaled_width < self.screen_width:
@@ -547,41 +830,45 @@ class TileScope:
 
     def adjust_zoom_at_mouse(self, factor):
         mouse_x, mouse_y = pygame.mouse.get_pos()
-        panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
         # Only zoom if mouse is over the tileset area (not the UI panel)
-        if mouse_y < self.screen_height - panel_height :
+        if mouse_y < self.view_bottom:
             self._adjust_zoom_internal(factor, float(mouse_x), float(mouse_y))
 
     def adjust_zoom_at_center(self, factor):
-        panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
         view_center_x = self.screen_width / 2.0
-        view_center_y = (self.screen_height - panel_height) / 2.0
+        view_center_y = self.view_bottom / 2.0
         self._adjust_zoom_internal(factor, view_center_x, view_center_y)
 
     def toggle_grid(self):
         self.show_grid = not self.show_grid
+        self.grid_numbers_overlay_dirty = True
         button = self.buttons.get("grid")
         if button:
             if self.show_grid: button.select()
             else: button.unselect()
         # Update raw setting for saving
-        self.settings_raw.setdefault("Toggles", {})["show_grid_default"] = "true" if self.show_grid else "false"
+        self._set_setting_raw("Toggles", "show_grid_default", "true" if self.show_grid else "false")
 
     def toggle_numbers(self):
         self.show_numbers = not self.show_numbers
+        self.grid_numbers_overlay_dirty = True
         button = self.buttons.get("numbers")
         if button:
             if self.show_numbers: button.select()
             else: button.unselect()
-        self.settings_raw.setdefault("Toggles", {})["show_numbers_default"] = "true" if self.show_numbers else "false"
+        self._set_setting_raw("Toggles", "show_numbers_default", "true" if self.show_numbers else "false")
 
     def toggle_background_overlay(self):
         self.show_background_overlay = not self.show_background_overlay
+        self.static_view_dirty = True
+        self.visible_view_key = None # Views switch between the plain and the dimmed mip levels
+        if not self.show_background_overlay: # Free the dimmed copies while unused; they are rebuilt on demand
+            self.dimmed_mip_levels.clear()
         button = self.buttons.get("bg_overlay")
         if button:
             if self.show_background_overlay: button.select()
             else: button.unselect()
-        self.settings_raw.setdefault("Toggles", {})["show_background_overlay_default"] = "true" if self.show_background_overlay else "false"
+        self._set_setting_raw("Toggles", "show_background_overlay_default", "true" if self.show_background_overlay else "false")
 
     def toggle_ui_panel_visibility(self):
         self.show_ui_panel_flag = not self.show_ui_panel_flag
@@ -593,6 +880,7 @@ class TileScope:
             else:
                 self.ui_panel.hide()
                 if hide_ui_button: hide_ui_button.set_text("Show UI (F1)")
+        self._update_panel_state()
         self.clamp_offset() # Recalculate viewable area and clamp offset
 
     def request_export(self):
@@ -602,21 +890,92 @@ class TileScope:
         # Custom tile ID computation logic
         return (col % 16) + (col // 16) * 512 + row * 16
 
+    def compute_tile_ids_grid(self):
+        # compute_tile_id only uses % // * +, so it broadcasts over a column vector and a row vector
+        # to give every ID as a (ROWS, COLS) array in one step
+        return self.compute_tile_id(np.arange(COLS, dtype=np.intp), np.arange(ROWS, dtype=np.intp)[:, np.newaxis])
+
+    def _is_tile_selected(self, col, row):
+        return self.selected_mask[self.tile_ids[row * COLS + col]]
+
+    def _toggle_tile_selected(self, col, row):
+        tile_id = self.tile_ids[row * COLS + col]
+        self.selected_count += -1 if self.selected_mask[tile_id] else 1
+        self.selected_mask[tile_id] = not self.selected_mask[tile_id]
+
+    def _select_only_tile(self, col, row):
+        self.selected_mask[:] = False
+        self.selected_count = 0
+        self._toggle_tile_selected(col, row)
+
+    def _selected_cells(self, start_col=0, end_col=COLS, start_row=0, end_row=ROWS):
+        # Column and row arrays of the selected cells within the given window, in cell order, found by
+        # gathering the mask through the window's tile IDs in one vectorized step
+        window_mask = self.selected_mask[self.tile_id_grid[start_row:end_row, start_col:end_col]]
+        rows, cols = np.nonzero(window_mask)
+        return cols + start_col, rows + start_row
+
+    def _iter_selected_tiles(self, start_col=0, end_col=COLS, start_row=0, end_row=ROWS):
+        # Selected (col, row) in cell order within the given window
+        cols, rows = self._selected_cells(start_col, end_col, start_row, end_row)
+        return zip(cols.tolist(), rows.tolist())
+
     def get_tile_from_id(self, tile_id):
         if not (0 <= tile_id < TOTAL_TILES): return None
-        # This could be optimized if performance becomes an issue for large tilesets
-        for r_idx in range(ROWS):
-            for c_idx in range(COLS):
-                if self.compute_tile_id(c_idx, r_idx) == tile_id:
-                    return c_idx, r_idx
-        return None
+        return self.tile_cells[tile_id] # None for IDs no cell maps to
 
     def export_tileset_image(self):
+        if self.export_thread is not None: # Only one export at a time
+            self.show_temp_message("Export already in progress.", "info")
+            return
+        file_path = self._prepare_export()
+        if not file_path: # User cancelled
+            self.show_export_progress = False
+            return
+        export_dir = os.path.dirname(file_path)
+        export_ext = os.path.splitext(file_path)[1].lower() # Path split once, shared by the worker and the settings
+
+        # Snapshot everything the export needs, so the worker never reads state the main loop may change
+        overlay_color = self.overlay_color if self.show_background_overlay else None
+        grid_color = self.grid_color if self.show_grid else None
+        # The composited image only depends on the base image, the enabled decorations and their colors and
+        # label surfaces (re-rendered as a new list on any font change), so exporting again, e.g. to another
+        # format, reuses the last one and only encodes
+        export_key = (self.base_tileset_image, overlay_color, grid_color,
+                      self.pre_rendered_tile_numbers if self.show_numbers else None)
+        export_surf = None
+        compose_args = None
+        if self.cached_export is not None and self.cached_export[0] == export_key:
+            export_surf = self.cached_export[1]
+            self.export_progress = 1
+        else:
+            label_offsets = None
+            if self.show_numbers:
+                # Centering offset of each pre-rendered label inside a tile, computed once
+                label_offsets = [(number_surf, (TILE_SIZE - number_surf.get_width()) // 2, (TILE_SIZE - number_surf.get_height()) // 2)
+                                 for number_surf in self.pre_rendered_tile_numbers]
+            compose_args = (self.base_tileset_image.copy(), overlay_color, grid_color, label_offsets)
+
+        # Compositing and encoding run on a worker thread; the main loop keeps pumping events, drawing the
+        # progress bar and picks up the result in _poll_export_thread
+        self.export_thread = threading.Thread(
+            target=self._run_export,
+            args=(file_path, export_ext, export_surf, compose_args, export_key),
+            daemon=True)
+        self.export_thread.start()
+
+        # Update default path and format for next time, once the export is under way
+        self._set_setting_raw("Export", "default_path", export_dir)
+        self._set_setting_raw("Export", "default_format", export_ext.lstrip('.') or "png")
+
+    def _prepare_export(self):
+        # Main thread only: shows the progress bar and the save dialog, returns the chosen path or ""
+        from tkinter import filedialog
         self.show_export_progress = True
         self.export_progress = 0
         pygame.display.flip() # Show initial progress bar state
 
-        root = tk.Tk(); root.withdraw() # Hide main Tkinter window
+        root = self._get_tk_root() # Shared hidden root, so the dialog does not open a blank Tk window
 
         default_path_str = self._get_setting("Export", "default_path", str, ".")
         if default_path_str == ".": default_path_str = os.getcwd()
@@ -624,75 +983,105 @@ class TileScope:
         file_ext = self._get_setting("Export", "default_format", str, "png").lower()
         if file_ext not in ["png", "jpg", "jpeg", "bmp"]: file_ext = "png" # Ensure valid default
 
-        file_path = filedialog.asksaveasfilename(
+        return filedialog.asksaveasfilename(
+            parent=root,
             initialdir=default_path_str,
             initialfile=f"tileset_export.{file_ext}",
             defaultextension=f".{file_ext}",
             filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg;*.jpeg"), ("BMP files", "*.bmp")]
         )
-        if not file_path: # User cancelled
-            self.show_export_progress = False
-            return
 
-        # Update default path and format for next time
-        self.settings_raw.setdefault("Export", {})["default_path"] = os.path.dirname(file_path)
-        self.settings_raw.setdefault("Export", {})["default_format"] = os.path.splitext(file_path)[1].lstrip('.').lower() or "png"
+    def _run_export(self, file_path, export_ext, export_surf, compose_args, export_key):
+        # Runs off the main thread: only touches the snapshot it was given, export_progress and
+        # export_results. It never pumps or reads pygame events; those stay with the main loop.
+        # Any failure, while compositing or saving, must reach the queue; otherwise the thread dies silently
+        # and _poll_export_thread just takes the progress bar down
+        new_cache = None # A freshly built image goes back to the main thread, see _poll_export_thread
+        try:
+            if export_surf is None: # Not cached, composite it first
+                export_surf = self._compose_export_surface(*compose_args)
+                new_cache = (export_key, export_surf) # Only a fully built image is reused
+            self._save_export_surface(export_surf, file_path, export_ext)
+            self.export_results.put((f"Exported to {os.path.basename(file_path)}", "success", new_cache))
+        except Exception as e:
+            self.export_results.put((f"Error exporting: {e}", "error", new_cache))
+            print(f"Export error: {e}")
 
+    def _compose_export_surface(self, base_image, overlay_color, grid_color, label_offsets):
         export_surf = pygame.Surface((TILESET_WIDTH, TILESET_HEIGHT))
-        export_surf.blit(self.base_tileset_image, (0, 0))
+        export_surf.blit(base_image, (0, 0))
 
         # Apply visual overlays if they are enabled
-        if self.show_background_overlay:
-            export_overlay_tile_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-            export_overlay_tile_surf.fill(self._get_setting("DisplayColors", "overlay_color", tuple, (0,0,0,70)))
-            for r_idx in range(ROWS):
-                for c_idx in range(COLS):
-                    export_surf.blit(export_overlay_tile_surf, (c_idx * TILE_SIZE, r_idx * TILE_SIZE))
-
-        if self.show_grid:
-            grid_color = self._get_setting("DisplayColors", "grid_color", tuple, (60,70,90))
-            for x_coord in range(0, TILESET_WIDTH + 1, TILE_SIZE):
-                pygame.draw.line(export_surf, grid_color, (x_coord, 0), (x_coord, TILESET_HEIGHT), 1)
-            for y_coord in range(0, TILESET_HEIGHT + 1, TILE_SIZE):
-                pygame.draw.line(export_surf, grid_color, (0, y_coord), (TILESET_WIDTH, y_coord), 1)
-
-        if self.show_numbers:
-            total_export_tiles = COLS * ROWS
-            processed_tiles = 0
+        overlay_alpha = overlay_color[3] if overlay_color is not None and len(overlay_color) > 3 else 255
+        if overlay_color is None or overlay_alpha == 0:
+            pass # Nothing to blend
+        elif overlay_alpha == 255: # Opaque overlay simply replaces the image, a plain fill needs no extra surface
+            export_surf.fill(overlay_color[:3])
+        else: # One full-size blit instead of one per tile
+            export_overlay_surf = pygame.Surface((TILESET_WIDTH, TILESET_HEIGHT), pygame.SRCALPHA)
+            export_overlay_surf.fill(overlay_color)
+            export_surf.blit(export_overlay_surf, (0, 0))
+
+        if grid_color is not None:
+            pixels = pygame.surfarray.pixels3d(export_surf) # Every grid line as two strided assignments
+            pixels[::TILE_SIZE, :] = grid_color[:3]
+            pixels[:, ::TILE_SIZE] = grid_color[:3]
+            del pixels # Release the surface lock
+
+        if label_offsets is not None:
+            tile_label_nums = self.tile_label_nums
+            col_xs = [(c_idx, c_idx * TILE_SIZE) for c_idx in range(COLS)] # Tile left edges, shared by every row
             for r_idx in range(ROWS):
-                for c_idx in range(COLS):
-                    tile_id_val = self.compute_tile_id(c_idx, r_idx)
-                    label_str = f"{tile_id_val % 100:02d}" # Display last two digits of ID
-                    number_surf = self.pre_rendered_tile_numbers.get(label_str)
-                    if number_surf:
-                        tx = c_idx * TILE_SIZE + (TILE_SIZE - number_surf.get_width()) // 2
-                        ty = r_idx * TILE_SIZE + (TILE_SIZE - number_surf.get_height()) // 2
-                        export_surf.blit(number_surf, (tx, ty))
-
-                    processed_tiles +=1
-                    if processed_tiles % 100 == 0: # Update progress bar periodically
-                        self.export_progress = processed_tiles / total_export_tiles
-                        self.draw_export_progress_bar() # Draw directly to screen
-                        pygame.display.flip()
-                        for evt in pygame.event.get(): # Keep UI responsive
-                             if evt.type == pygame.QUIT:
-                                 self.show_export_progress = False
-                                 return # Abort export if user quits
+                # Each row of numbers goes to SDL as one batched call
+                row_blits = []
+                row_base = r_idx * COLS
+                row_y = r_idx * TILE_SIZE
+                for c_idx, col_x in col_xs:
+                    number_surf, dx, dy = label_offsets[tile_label_nums[row_base + c_idx]] # Last two digits of ID
+                    row_blits.append((number_surf, (col_x + dx, row_y + dy)))
+                if HAS_FBLITS: export_surf.fblits(row_blits)
+                else: export_surf.blits(row_blits, doreturn=False)
+                self.export_progress = (r_idx + 1) / ROWS # Picked up by the progress bar on the next frame
+        return export_surf
+
+    def _save_export_surface(self, export_surf, file_path, ext):
+        # Pillow lets the encoder settings be chosen (fast PNG compression, explicit JPEG quality) and
+        # releases the GIL while encoding; without it, or for any other extension, pygame's own encoder is
+        # used, which still writes a file (TGA) for unknown or missing extensions
+        if ext not in (".png", ".jpg", ".jpeg", ".bmp"):
+            pygame.image.save(export_surf, file_path)
+            return
         try:
+            from PIL import Image
+        except ImportError:
             pygame.image.save(export_surf, file_path)
-            self.show_temp_message(f"Exported to {os.path.basename(file_path)}", "success")
-        except pygame.error as e:
-            self.show_temp_message(f"Error saving: {e}", "error")
-            print(f"Export error: {e}")
-        finally:
-            self.show_export_progress = False
+            return
+        image = Image.frombytes("RGB", export_surf.get_size(), pygame.image.tobytes(export_surf, "RGB"))
+        if ext == ".png":
+            image.save(file_path, optimize=False, compress_level=1)
+        elif ext in (".jpg", ".jpeg"):
+            image.save(file_path, quality=90)
+        else:
+            image.save(file_path)
+
+    def _poll_export_thread(self):
+        if self.export_thread is None or self.export_thread.is_alive(): return
+        self.export_thread = None
+        self.show_export_progress = False
+        self.needs_redraw = True # Take the progress bar off the screen
+        while not self.export_results.empty():
+            message, level, new_cache = self.export_results.get_nowait()
+            # Cached on the main thread, and only if the image it was built from is still the one loaded;
+            # otherwise it would keep the replaced image and its export alive
+            if new_cache is not None and new_cache[0][0] is self.base_tileset_image:
+                self.cached_export = new_cache
+            self.show_temp_message(message, level)
 
     def reset_view(self):
         self.zoom = 1.0
         self.update_scaled_tileset_and_overlays() # Update scaling first
         # Then calculate offset based on new scaled size
-        panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
-        view_height = self.screen_height - panel_height
+        view_height = self.view_bottom
         current_display_width = TILESET_WIDTH * self.actual_applied_zoom
         current_display_height = TILESET_HEIGHT * self.actual_applied_zoom
         self.offset_x = (self.screen_width - current_display_width) / 2.0
@@ -700,22 +1089,33 @@ class TileScope:
         self.clamp_offset()
 
     def open_image_dialog(self):
-        root = tk.Tk(); root.withdraw()
+        from tkinter import filedialog
+        root = self._get_tk_root() # Shared hidden root, so the dialog does not open a blank Tk window
         current_path = self._get_setting("Export", "default_path", str, ".")
         if current_path == ".": current_path = os.getcwd()
 
         file_path = filedialog.askopenfilename(
+            parent=root,
             initialdir=current_path,
             title="Select Tileset Image",
             filetypes=[("Image files", "*.png;*.jpg;*.jpeg;*.bmp;*.tga"), ("All files", "*.*")]
         )
         if file_path:
             self.base_tileset_image = self.create_base_tileset_image(file_path)
-            self.settings_raw.setdefault("Export", {})["default_path"] = os.path.dirname(file_path) # Update default path
+            self._set_setting_raw("Export", "default_path", os.path.dirname(file_path)) # Update default path
             self.reset_view() # Reset zoom and pan
 
+    def _get_tk_root(self):
+        # One hidden Tk root is created on first use and shared by all dialogs and the clipboard,
+        # instead of paying Tk's startup cost on every action
+        if self.tk_root is None:
+            import tkinter as tk
+            self.tk_root = tk.Tk(); self.tk_root.withdraw() # Hide main Tkinter window
+        return self.tk_root
+
     def activate_search_dialog(self):
-        root = tk.Tk(); root.withdraw()
+        from tkinter import simpledialog
+        root = self._get_tk_root()
         tile_id_str = simpledialog.askstring("Search Tile", "Enter Tile ID (0-4095):", parent=root)
         if tile_id_str:
             try:
@@ -731,7 +1131,7 @@ class TileScope:
         coords = self.get_tile_from_id(tile_id)
         if coords:
             col, row = coords
-            self.selected_tiles = {(col, row)} # Select the found tile
+            self._select_only_tile(col, row) # Select the found tile
 
             if self.zoom < 2.0: self.zoom = 2.0 # Zoom in if not already zoomed
             self.update_scaled_tileset_and_overlays()
@@ -740,9 +1140,8 @@ class TileScope:
             tile_center_x_on_image = (col + 0.5) * TILE_SIZE * self.actual_applied_zoom
             tile_center_y_on_image = (row + 0.5) * TILE_SIZE * self.actual_applied_zoom
 
-            panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
             view_center_x_screen = self.screen_width / 2.0
-            view_center_y_screen = (self.screen_height - panel_height) / 2.0
+            view_center_y_screen = self.view_bottom / 2.0
 
             self.offset_x = view_center_x_screen - tile_center_x_on_image
             self.offset_y = view_center_y_screen - tile_center_y_on_image
@@ -752,17 +1151,19 @@ class TileScope:
         return False
 
     def copy_selected_ids_to_clipboard(self):
-        if not self.selected_tiles:
+        if not self.selected_count:
             self.show_temp_message("No tiles selected.", "info")
             return
-        ids_str = ", ".join(sorted([str(self.compute_tile_id(c, r)) for c, r in self.selected_tiles]))
+        ids_str = ", ".join(map(str, np.flatnonzero(self.selected_mask).tolist())) # Mask index is the ID, so already sorted
         try:
-            root = tk.Tk(); root.withdraw()
-            root.clipboard_clear()
-            root.clipboard_append(ids_str)
-            root.update() # Process clipboard events
-            root.destroy()
-            self.show_temp_message(f"{len(self.selected_tiles)} ID(s) copied: {ids_str[:50]}...", "success")
+            if HAS_SCRAP_TEXT: # SDL's own clipboard, no Tk needed
+                pygame.scrap.put_text(ids_str)
+            else:
+                root = self._get_tk_root()
+                root.clipboard_clear()
+                root.clipboard_append(ids_str)
+                root.update() # Process clipboard events; the root stays alive so the clipboard keeps its content
+            self.show_temp_message(f"{self.selected_count} ID(s) copied: {ids_str[:50]}...", "success")
         except Exception as e:
             self.show_temp_message(f"Error copying to clipboard: {e}", "error")
             print(f"Clipboard error: {e}")
@@ -770,8 +1171,10 @@ class TileScope:
 
     def show_temp_message(self, message, level="info"):
         self.temp_message = {"text": message, "level": level, "time": pygame.time.get_ticks()}
+        self.needs_redraw = True
 
     def _open_file_location(self, file_path_to_open): # Currently unused by active UI, but kept for potential future use
+        import subprocess
         directory = os.path.dirname(os.path.abspath(file_path_to_open))
         if not os.path.exists(directory): # Fallback if path is relative or doesn't exist
             directory = os.path.abspath(os.path.dirname(sys.argv[0])) # App's directory
@@ -789,26 +1192,21 @@ class TileScope:
             print(f"Error opening folder {directory}: {e}")
 
     def get_visible_tile_range(self):
-        panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
-        safe_actual_zoom = self.actual_applied_zoom if self.actual_applied_zoom > 1e-6 else 1.0 # Avoid division by zero
-
-        # Calculate visible portion of the base (unscaled) image
-        base_img_x_start = -self.offset_x / safe_actual_zoom
-        base_img_y_start = -self.offset_y / safe_actual_zoom
-        base_img_view_width = self.screen_width / safe_actual_zoom
-        base_img_view_height = (self.screen_height - panel_height) / safe_actual_zoom
-        base_img_x_end = base_img_x_start + base_img_view_width
-        base_img_y_end = base_img_y_start + base_img_view_height
-
-        # Determine column and row range, with a small buffer for partial tiles
-        start_col = max(0, int(base_img_x_start // TILE_SIZE))
-        end_col = min(COLS, int(base_img_x_end // TILE_SIZE) + 2) # +2 for buffer
-        start_row = max(0, int(base_img_y_start // TILE_SIZE))
-        end_row = min(ROWS, int(base_img_y_end // TILE_SIZE) + 2) # +2 for buffer
+        # Screen edges converted straight to tile units with the reciprocal cached on zoom changes
+        tiles_per_px = self.tiles_per_screen_px
+        left = -self.offset_x
+        top = -self.offset_y
+
+        # Determine column and row range; the +1 takes in the partially visible tile at the far edge
+        start_col = max(0, math.floor(left * tiles_per_px))
+        end_col = min(COLS, math.floor((left + self.screen_width) * tiles_per_px) + 1)
+        start_row = max(0, math.floor(top * tiles_per_px))
+        end_row = min(ROWS, math.floor((top + self.view_bottom) * tiles_per_px) + 1)
         return start_col, end_col, start_row, end_row
 
     def handle_events(self, time_delta):
         for event in pygame.event.get():
+            self.needs_redraw = True # Any input, resize or window event may change what is on screen
             # Pass event to Pygame GUI manager first
             ui_consumed_event = self.ui_manager.process_events(event)
 
@@ -817,45 +1215,33 @@ class TileScope:
                 return False # Signal to exit main loop
 
             elif event.type == pygame.VIDEORESIZE:
-                self.screen_width = max(600, event.w) # Enforce minimum size
-                self.screen_height = max(400, event.h)
-                self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
-                self.ui_manager.set_window_resolution((self.screen_width, self.screen_height))
-                self.setup_ui_elements() # Recreate UI for new size
-                self.clamp_offset()
-                self.update_scaled_tileset_and_overlays()
+                # Dragging a window edge sends a burst of these; only the last size is applied
+                self.pending_resize = (event.w, event.h)
 
             elif event.type == pygame_gui.UI_BUTTON_PRESSED:
-                action_to_perform = None
-                for row_key in self.button_configs: # Check both rows of buttons
-                    for key, _, action_func, _ in self.button_configs[row_key]:
-                        button_instance = self.buttons.get(key)
-                        if button_instance == event.ui_element:
-                            action_to_perform = action_func
-                            break
-                    if action_to_perform: break
+                self._apply_pending_resize() # Actions must see the current layout
+                self._apply_drag_delta() # and the panned offset
+                action_to_perform = self.button_actions.get(event.ui_element) # None for non-panel elements
                 if action_to_perform:
                     action_to_perform()
                 ui_consumed_event = True # Ensure GUI button presses don't trigger other actions
 
             if not ui_consumed_event: # Process events not handled by the UI
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
+                    self._apply_pending_resize() # Clicks and wheel zoom must see the current layout
+                    self._apply_drag_delta() # and the panned offset
                     # Check if click is outside the UI panel area
-                    if event.pos[1] < self.screen_height - panel_height:
+                    if event.pos[1] < self.view_bottom:
                         if event.button == 1: # Left click
                             self.dragging = True
                             self.last_mouse_pos = event.pos
+                            self._update_hover_from_pos(event.pos) # Hover may lag motion queued this frame
                             if self.hover_col is not None and self.hover_row is not None:
-                                tile_coords = (self.hover_col, self.hover_row)
                                 mods = pygame.key.get_mods()
                                 if mods & pygame.KMOD_SHIFT or mods & pygame.KMOD_CTRL: # Add/remove from selection
-                                    if tile_coords in self.selected_tiles:
-                                        self.selected_tiles.remove(tile_coords)
-                                    else:
-                                        self.selected_tiles.add(tile_coords)
+                                    self._toggle_tile_selected(self.hover_col, self.hover_row)
                                 else: # New selection
-                                    self.selected_tiles = {tile_coords}
+                                    self._select_only_tile(self.hover_col, self.hover_row)
                         elif event.button == 4: # Mouse wheel up
                             self.adjust_zoom_at_mouse(1.1)
                         elif event.button == 5: # Mouse wheel down
@@ -869,28 +1255,18 @@ class TileScope:
             # but dragging only if not consumed and button is down.
             if event.type == pygame.MOUSEMOTION:
                 if self.dragging: # Dragging is already conditional on not being UI consumed
-                    dx = event.pos[0] - self.last_mouse_pos[0]
-                    dy = event.pos[1] - self.last_mouse_pos[1]
-                    self.offset_x += dx
-                    self.offset_y += dy
+                    # Deltas are summed and applied once after the event loop (see _apply_drag_delta)
+                    self.drag_dx += event.pos[0] - self.last_mouse_pos[0]
+                    self.drag_dy += event.pos[1] - self.last_mouse_pos[1]
                     self.last_mouse_pos = event.pos
-                    self.clamp_offset()
-
-                # Update hover tile regardless of dragging or UI consumption
-                panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
-                if event.pos[1] < self.screen_height - panel_height: # Mouse is over tileset area
-                    safe_actual_zoom = self.actual_applied_zoom if self.actual_applied_zoom > 1e-6 else 1.0
-                    img_x = (event.pos[0] - self.offset_x) / safe_actual_zoom
-                    img_y = (event.pos[1] - self.offset_y) / safe_actual_zoom
-                    if 0 <= img_x < TILESET_WIDTH and 0 <= img_y < TILESET_HEIGHT:
-                        self.hover_col = int(img_x // TILE_SIZE)
-                        self.hover_row = int(img_y // TILE_SIZE)
-                    else:
-                        self.hover_col = None; self.hover_row = None
-                else: # Mouse is over UI panel or outside window
-                    self.hover_col = None; self.hover_row = None
+
+                # Hover tile is updated regardless of dragging or UI consumption, but only for the
+                # last position of the frame (see run), not for every motion event in the queue
+                self.pending_mouse_pos = event.pos
 
             if event.type == pygame.KEYDOWN: # Keyboard shortcuts
+                self._apply_pending_resize() # Shortcuts must see the current layout
+                self._apply_drag_delta() # and the panned offset
                 if event.key == pygame.K_F1:
                     self.toggle_ui_panel_visibility()
                 elif event.key == pygame.K_r:
@@ -907,103 +1283,87 @@ class TileScope:
                     self.copy_selected_ids_to_clipboard()
                 elif event.key == pygame.K_f and (pygame.key.get_mods() & pygame.KMOD_CTRL):
                     self.activate_search_dialog()
+        self._apply_pending_resize()
+        self._apply_drag_delta()
         return True # Continue running
 
-    def draw_grid_and_overlays(self):
-        start_col, end_col, start_row, end_row = self.get_visible_tile_range()
-        on_screen_tile_size = TILE_SIZE * self.actual_applied_zoom
-        on_screen_tile_size_px = round(on_screen_tile_size) # Pixel size for drawing
-
-        # Draw Grid
-        if self.show_grid and on_screen_tile_size_px > 1: # Only draw if visible and tiles are large enough
-            grid_color = self._get_setting("DisplayColors", "grid_color", tuple, (60,70,90))
-            panel_h = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
-            view_bottom_y = self.screen_height - panel_h
-
-            for c_idx in range(start_col, end_col + 1):
-                x = round(self.offset_x + c_idx * on_screen_tile_size)
-                # Clip lines to visible area
-                y_start_on_grid = self.offset_y
-                y_end_on_grid = self.offset_y + TILESET_HEIGHT * self.actual_applied_zoom
-                draw_y_start = round(max(y_start_on_grid, 0))
-                draw_y_end = round(min(y_end_on_grid, view_bottom_y))
-                if draw_y_start < draw_y_end and -1 <= x <= self.screen_width + 1 : # Check if line is on screen
-                    pygame.draw.line(self.screen, grid_color, (x, draw_y_start), (x, draw_y_end), 1)
-
-            for r_idx in range(start_row, end_row + 1):
-                y = round(self.offset_y + r_idx * on_screen_tile_size)
-                x_start_on_grid = self.offset_x
-                x_end_on_grid = self.offset_x + TILESET_WIDTH * self.actual_applied_zoom
-                draw_x_start = round(max(x_start_on_grid, 0))
-                draw_x_end = round(min(x_end_on_grid, self.screen_width))
-                if draw_x_start < draw_x_end and -1 <= y <= view_bottom_y + 1:
-                    pygame.draw.line(self.screen, grid_color, (draw_x_start, y), (draw_x_end, y), 1)
-
-        # Draw Tile Numbers
-        if self.show_numbers and on_screen_tile_size_px >= 4 : # Only draw if visible and enough space
-            base_font_calc_size = int(self._get_setting("FontSettings", "tile_number_reference_font_size", int, 10) * self.zoom)
-            target_num_font_size = max(4, min(base_font_calc_size, 40)) # Clamp font size
+    def _apply_pending_resize(self):
+        # Window size, UI layout and view for the last resize queued since the last call
+        if self.pending_resize is None: return
+        new_w, new_h = self.pending_resize
+        self.pending_resize = None
+        self.screen_width = max(600, new_w) # Enforce minimum size
+        self.screen_height = max(400, new_h)
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+        self.ui_manager.set_window_resolution((self.screen_width, self.screen_height))
+        self.setup_ui_elements() # Move and stretch the UI for the new size
+        self._update_panel_state()
+        self.clamp_offset()
+        self.update_scaled_tileset_and_overlays()
 
-            if target_num_font_size >= 4: # Ensure font is reasonably sized
-                font_name = self._get_setting("FontSettings", "tile_number_font_name", str, "Arial")
-                text_color = self._get_setting("TextColors", "tile_number_text", tuple, (220,220,220))
-                font_aa = self._get_setting("FontSettings", "tile_number_font_aa", bool, True)
+    def _apply_drag_delta(self):
+        # One offset update and clamp for all drag motion queued since the last call
+        if self.drag_dx or self.drag_dy:
+            self.offset_x += self.drag_dx
+            self.offset_y += self.drag_dy
+            self.drag_dx = self.drag_dy = 0
+            self.clamp_offset()
 
-                font_cache_key = (font_name, target_num_font_size, font_aa)
-                current_font = self.cached_fonts.get(font_cache_key)
-                if not current_font:
-                    try: current_font = pygame.font.SysFont(font_name, target_num_font_size)
-                    except pygame.error: current_font = pygame.font.SysFont("Arial", target_num_font_size) # Fallback
-                    self.cached_fonts[font_cache_key] = current_font
+    def _update_hover_from_pos(self, pos):
+        self.pending_mouse_pos = None
+        if pos[1] < self.view_bottom: # Mouse is over tileset area
+            # Integer position relative to the tileset origin, looked up in the cached tile edges
+            rel_x = pos[0] - round(self.offset_x)
+            rel_y = pos[1] - round(self.offset_y)
+            if 0 <= rel_x < self.tile_edge_px[COLS] and 0 <= rel_y < self.tile_edge_px[ROWS]:
+                self.hover_col = bisect.bisect_right(self.tile_edge_px, rel_x, 0, COLS + 1) - 1
+                self.hover_row = bisect.bisect_right(self.tile_edge_px, rel_y, 0, ROWS + 1) - 1
+                return
+        # Mouse is over UI panel, outside window or off the tileset
+        self.hover_col = None; self.hover_row = None
 
-                for r_idx in range(start_row, end_row):
-                    for c_idx in range(start_col, end_col):
-                        if not (0 <= c_idx < COLS and 0 <= r_idx < ROWS): continue # Bounds check
-                        tile_id_val = self.compute_tile_id(c_idx, r_idx)
-                        label_str = f"{tile_id_val % 100:02d}" # Last two digits
-
-                        num_surf_cache_key = (label_str, font_name, target_num_font_size, font_aa) # Cache key for rendered number
-                        final_number_surf = self.cached_rendered_numbers.get(num_surf_cache_key)
-                        if not final_number_surf:
-                            final_number_surf = current_font.render(label_str, font_aa, text_color)
-                            self.cached_rendered_numbers[num_surf_cache_key] = final_number_surf
-
-                        # Center number in tile
-                        scr_x_center = self.offset_x + (c_idx + 0.5) * on_screen_tile_size
-                        scr_y_center = self.offset_y + (r_idx + 0.5) * on_screen_tile_size
-                        num_rect = final_number_surf.get_rect(center=(round(scr_x_center), round(scr_y_center)))
-                        self.screen.blit(final_number_surf, num_rect)
+    def draw_grid_and_overlays(self):
+        # Grid and tile numbers are part of the static view composited in _update_static_view,
+        # so with nothing selected or hovered there is nothing left to draw here
+        if not self.selected_count and self.hover_col is None: return
+        # Visible window computed once per frame by _update_visible_tileset_view
+        start_col, end_col, start_row, end_row = self.visible_view_range
+        on_screen_tile_size = TILE_SIZE * self.actual_applied_zoom
+        on_screen_tile_size_px = round(on_screen_tile_size) # Pixel size for drawing
+        if on_screen_tile_size_px < 1: return
 
         # Draw Selected Tile Highlights
-        if self.selected_tiles and self.cached_scaled_select_surface and on_screen_tile_size_px >= 1:
-            for col, row in self.selected_tiles:
-                if start_col <= col < end_col and start_row <= row < end_row: # Only draw if visible
-                    if 0 <= col < COLS and 0 <= row < ROWS: # Bounds check
-                        scr_x = round(self.offset_x + col * on_screen_tile_size)
-                        scr_y = round(self.offset_y + row * on_screen_tile_size)
-                        self.screen.blit(self.cached_scaled_select_surface, (scr_x, scr_y))
+        if self.selected_count:
+            # Only the visible window of the selection is looked at, and all highlights go to SDL in one
+            # batched call
+            select_surf = self.select_highlight_surface
+            # Screen positions are computed for all of them at once; np.rint rounds halves to even like round()
+            cols, rows = self._selected_cells(start_col, end_col, start_row, end_row)
+            select_xs = np.rint(self.offset_x + cols * on_screen_tile_size).astype(np.intp).tolist()
+            select_ys = np.rint(self.offset_y + rows * on_screen_tile_size).astype(np.intp).tolist()
+            select_positions = list(zip(select_xs, select_ys))
+            if select_positions:
+                if HAS_FBLITS:
+                    self.screen.fblits([(select_surf, pos) for pos in select_positions], pygame.BLEND_PREMULTIPLIED)
+                else:
+                    self.screen.blits([(select_surf, pos, None, pygame.BLEND_PREMULTIPLIED) for pos in select_positions],
+                                      doreturn=False)
 
         # Draw Hovered Tile Highlight
-        if self.hover_col is not None and self.hover_row is not None and \
-           self.cached_scaled_hover_surface and on_screen_tile_size_px >= 1:
+        if self.hover_col is not None and self.hover_row is not None:
              scr_x = round(self.offset_x + self.hover_col * on_screen_tile_size)
              scr_y = round(self.offset_y + self.hover_row * on_screen_tile_size)
-             self.screen.blit(self.cached_scaled_hover_surface, (scr_x, scr_y))
+             self.screen.blit(self.hover_highlight_surface, (scr_x, scr_y), special_flags=pygame.BLEND_PREMULTIPLIED)
 
     def draw_tooltip(self):
         if self.hover_col is None or self.hover_row is None: return
 
-        tile_id_val = self.compute_tile_id(self.hover_col, self.hover_row)
-        id_text_str = f"ID: {tile_id_val}"
-        pos_text_str = f"Pos: ({self.hover_col}, {self.hover_row})"
-
-        text_color = self._get_setting("TextColors", "tooltip_text", tuple, (230,230,230))
-        id_surf = self.ui_font.render(id_text_str, True, text_color)
-        pos_surf = self.ui_font.render(pos_text_str, True, text_color)
-
-        padding = 8
-        tooltip_w = max(id_surf.get_width(), pos_surf.get_width()) + 2 * padding
-        tooltip_h = id_surf.get_height() + pos_surf.get_height() + 3 * padding # Extra padding for line spacing
+        # The box only depends on the hovered tile, so it is rendered once per tile and then only moved
+        # with the mouse
+        if self.tooltip_cache is None or self.tooltip_cache[:2] != (self.hover_col, self.hover_row):
+            self.tooltip_cache = (self.hover_col, self.hover_row, self._render_tooltip(self.hover_col, self.hover_row))
+        tooltip_surf = self.tooltip_cache[2]
+        tooltip_w, tooltip_h = tooltip_surf.get_size()
 
         mx, my = pygame.mouse.get_pos()
         tt_x = mx + 15 # Offset from mouse
@@ -1011,50 +1371,87 @@ class TileScope:
 
         # Keep tooltip on screen
         tt_x = max(5, min(tt_x, self.screen_width - tooltip_w - 5))
-        panel_h = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
         if tt_y < 5 : tt_y = my + 15 # If too high, move below mouse
-        tt_y = max(5, min(tt_y, self.screen_height - panel_h - tooltip_h - 5))
+        tt_y = max(5, min(tt_y, self.view_bottom - tooltip_h - 5))
 
+        self.screen.blit(tooltip_surf, (tt_x, tt_y))
 
-        pygame.draw.rect(self.screen, self._get_setting("TooltipAppearance", "tooltip_background", tuple, (20,20,30,220)),
-                         (tt_x, tt_y, tooltip_w, tooltip_h), border_radius=3)
-        pygame.draw.rect(self.screen, self._get_setting("TooltipAppearance", "tooltip_border", tuple, (70,130,180)),
-                         (tt_x, tt_y, tooltip_w, tooltip_h), 1, border_radius=3) # Border
+    def _render_tooltip(self, col, row):
+        tile_id_val = self.tile_ids[row * COLS + col]
+        id_text_str = f"ID: {tile_id_val}"
+        pos_text_str = f"Pos: ({col}, {row})"
 
-        self.screen.blit(id_surf, (tt_x + padding, tt_y + padding))
-        self.screen.blit(pos_surf, (tt_x + padding, tt_y + padding + id_surf.get_height() + padding // 2))
+        text_color = self.tooltip_text_color
+        id_surf = self.ui_font.render(id_text_str, True, text_color)
+        pos_surf = self.ui_font.render(pos_text_str, True, text_color)
+
+        padding = 8
+        tooltip_w = max(id_surf.get_width(), pos_surf.get_width()) + 2 * padding
+        tooltip_h = id_surf.get_height() + pos_surf.get_height() + 3 * padding # Extra padding for line spacing
+
+        # Transparent only outside the rounded corners; the box itself is opaque, as it was when the
+        # rects were drawn straight onto the (alpha-less) screen
+        tooltip_surf = pygame.Surface((tooltip_w, tooltip_h), pygame.SRCALPHA).convert_alpha()
+        tooltip_surf.fill((0, 0, 0, 0))
+        pygame.draw.rect(tooltip_surf, self.tooltip_bg_color[:3],
+                         (0, 0, tooltip_w, tooltip_h), border_radius=3)
+        pygame.draw.rect(tooltip_surf, self.tooltip_border_color[:3],
+                         (0, 0, tooltip_w, tooltip_h), 1, border_radius=3) # Border
+
+        tooltip_surf.blits(((id_surf, (padding, padding)),
+                            (pos_surf, (padding, padding + id_surf.get_height() + padding // 2))),
+                           doreturn=False)
+        return tooltip_surf
+
+    def _cache_theme_colors(self):
+        # Theme lookups walk pygame_gui's theme tree and build new Color objects, so they are done once
+        # here instead of on every frame the progress bar or a message is drawn.
+        # Try to use theme colors, fallback to INI or hardcoded if theme not fully loaded/available
+        try:
+            theme = self.ui_manager.get_theme()
+            self.progress_bar_colors = (
+                pygame.Color(theme.get_colour('dark_bg', '#ui_panel')), # More specific
+                pygame.Color(theme.get_colour('selected_bg', 'button')),
+                pygame.Color(theme.get_colour('normal_text')),
+                pygame.Color(theme.get_colour('normal_border', '#ui_panel')))
+        except : # Broad except if theme colors aren't found (e.g., theme not loaded)
+            self.progress_bar_colors = (
+                pygame.Color(30,40,50),
+                pygame.Color(0,120,215),
+                pygame.Color(220,220,220),
+                self._get_setting("UIAppearance", "progress_bar_border", tuple, (70,100,130)))
+        self.progress_label = None # (percent, rendered label), re-rendered when either changes
+
+        try: # Try to use theme color for the temporary message background
+            bg_col_tuple = pygame.Color(self.ui_manager.get_theme().get_colour_string('dark_bg', '#ui_panel'))
+            self.message_bg_color = (bg_col_tuple.r, bg_col_tuple.g, bg_col_tuple.b, 220) # Semi-transparent
+        except: # Fallback
+            self.message_bg_color = (30,40,50,220)
 
     def draw_export_progress_bar(self):
-        if not self.show_export_progress: return
+        # Returns the screen rect drawn, for a partial display update
+        if not self.show_export_progress: return None
 
         bar_w, bar_h = 300, 30
         bar_x = (self.screen_width - bar_w) // 2
         bar_y = (self.screen_height - bar_h) // 2
 
-        # Try to use theme colors, fallback to INI or hardcoded if theme not fully loaded/available
-        try:
-            progress_bar_bg = pygame.Color(self.ui_manager.get_theme().get_colour('dark_bg', '#ui_panel')) # More specific
-            progress_bar_fill = pygame.Color(self.ui_manager.get_theme().get_colour('selected_bg', 'button'))
-            progress_text_color = pygame.Color(self.ui_manager.get_theme().get_colour('normal_text'))
-            progress_bar_border_from_theme = pygame.Color(self.ui_manager.get_theme().get_colour('normal_border', '#ui_panel'))
-        except : # Broad except if theme colors aren't found (e.g., theme not loaded)
-            progress_bar_bg = pygame.Color(30,40,50)
-            progress_bar_fill = pygame.Color(0,120,215)
-            progress_text_color = pygame.Color(220,220,220)
-            progress_bar_border_from_theme = self._get_setting("UIAppearance", "progress_bar_border", tuple, (70,100,130))
-
+        progress_bar_bg, progress_bar_fill, progress_text_color, progress_bar_border_from_theme = self.progress_bar_colors
         pygame.draw.rect(self.screen, progress_bar_bg, (bar_x, bar_y, bar_w, bar_h))
         pygame.draw.rect(self.screen, progress_bar_border_from_theme, (bar_x, bar_y, bar_w, bar_h), 2) # Border
         fill_w = int(bar_w * self.export_progress)
         pygame.draw.rect(self.screen, progress_bar_fill, (bar_x, bar_y, fill_w, bar_h))
 
-        text_str = f"Exporting... {int(self.export_progress * 100)}%"
-        text_surf = self.ui_font.render(text_str, True, progress_text_color)
+        percent = int(self.export_progress * 100)
+        if self.progress_label is None or self.progress_label[0] != percent: # Label only changes with the percent
+            self.progress_label = (percent, self.ui_font.render(f"Exporting... {percent}%", True, progress_text_color))
+        text_surf = self.progress_label[1]
         text_rect = text_surf.get_rect(center=(bar_x + bar_w // 2, bar_y + bar_h // 2))
         self.screen.blit(text_surf, text_rect)
+        return pygame.Rect(bar_x, bar_y, bar_w, bar_h)
 
     def draw_temporary_message(self):
-        if self.temp_message and (pygame.time.get_ticks() - self.temp_message["time"] < 2500): # Message visible for 2.5s
+        if self.temp_message and (pygame.time.get_ticks() - self.temp_message["time"] < TEMP_MESSAGE_DURATION_MS):
             msg = self.temp_message["text"]
             level = self.temp_message["level"]
             color_map = {
@@ -1063,12 +1460,7 @@ class TileScope:
             }
             text_color = color_map.get(level, (200,200,200)) # Default to light gray
 
-            try: # Try to use theme color for background
-                bg_col_str = self.ui_manager.get_theme().get_colour_string('dark_bg', '#ui_panel')
-                bg_col_tuple = pygame.Color(bg_col_str)
-                msg_bg_color = (bg_col_tuple.r, bg_col_tuple.g, bg_col_tuple.b, 220) # Semi-transparent
-            except: # Fallback
-                msg_bg_color = (30,40,50,220)
+            msg_bg_color = self.message_bg_color
 
             msg_surf = self.ui_font.render(msg, True, text_color)
             msg_rect = msg_surf.get_rect(center=(self.screen_width // 2, 30)) # Position at top-center
@@ -1077,25 +1469,23 @@ class TileScope:
             # Draw background surface for better readability
             bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
             bg_surf.fill(msg_bg_color)
-            self.screen.blit(bg_surf, bg_rect.topleft)
-            self.screen.blit(msg_surf, msg_rect.topleft)
+            self.screen.blits(((bg_surf, bg_rect.topleft), (msg_surf, msg_rect.topleft)), doreturn=False)
         elif self.temp_message: # Message timed out
             self.temp_message = None
 
     def draw_main_content(self):
-        self.screen.fill(self._get_setting("DisplayColors", "background", tuple, (25,30,40)))
+        self.screen.fill(self.bg_color)
 
-        if self.scaled_tileset_image:
-            self.screen.blit(self.scaled_tileset_image, (round(self.offset_x), round(self.offset_y)))
+        self._update_visible_tileset_view()
+        if self.static_view_dirty or self.grid_numbers_overlay_dirty:
+            self._update_static_view()
+        if self.cached_static_view: # Tileset, background overlay, grid and numbers
+            self.screen.blit(self.cached_static_view, self.get_visible_view_pos())
 
-        if self.show_background_overlay and self.tileset_area_overlay_surface:
-            self.screen.blit(self.tileset_area_overlay_surface, (round(self.offset_x), round(self.offset_y)))
-
-        self.draw_grid_and_overlays() # Grid, numbers, selection highlights
+        self.draw_grid_and_overlays() # Selection and hover highlights
         if self.hover_col is not None and self.hover_row is not None: # Only draw tooltip if hovering over a valid tile
-            panel_height = self.ui_panel_rect.height if self.show_ui_panel_flag and self.ui_panel and self.ui_panel.alive() else 0
             mx, my = pygame.mouse.get_pos()
-            if my < self.screen_height - panel_height: # Don't draw tooltip if mouse is over UI panel
+            if my < self.view_bottom: # Don't draw tooltip if mouse is over UI panel
                 self.draw_tooltip()
 
 
@@ -1109,22 +1499,37 @@ class TileScope:
 
             self.ui_manager.update(time_delta) # Update UI elements
 
-            self.draw_main_content() # Draw tileset, grid, overlays
-
-            if self.show_ui_panel_flag:
-                if self.ui_panel and self.ui_panel.alive(): # Ensure panel exists before drawing
+            # An idle viewer has nothing new to show, so full frames are only drawn and flipped after
+            # events. A temporary message is static, so it only costs a frame when shown and one when it
+            # expires; the export progress bar is opaque and is redrawn over the last frame on its own.
+            if self.temp_message and pygame.time.get_ticks() - self.temp_message["time"] >= TEMP_MESSAGE_DURATION_MS:
+                self.needs_redraw = True # draw_temporary_message drops it
+            if self.needs_redraw:
+                self.needs_redraw = False
+                if self.pending_mouse_pos is not None: # Mouse moved this frame
+                    self._update_hover_from_pos(self.pending_mouse_pos)
+                self.draw_main_content() # Draw tileset, grid, overlays
+
+                if self.ui_panel_visible: # Panel exists and is shown
                     self.ui_manager.draw_ui(self.screen) # Draw UI on top
 
-            self.draw_export_progress_bar() # Draw if exporting
-            self.draw_temporary_message()   # Draw if there's a message
+                self.draw_export_progress_bar() # Draw if exporting
+                self.draw_temporary_message()   # Draw if there's a message
 
-            pygame.display.flip() # Update the full display
+                pygame.display.flip() # Update the full display
+            elif self.show_export_progress:
+                pygame.display.update(self.draw_export_progress_bar()) # Only the bar changed
 
+            self._poll_export_thread() # Report a finished export
             if self.export_requested: # Handle export after drawing one frame of progress bar
                 self.export_tileset_image()
                 self.export_requested = False
 
         self.save_settings_to_ini() # Save settings on exit
+        if self.export_thread is not None:
+            self.export_thread.join() # Let a running export finish writing its file
+        if self.tk_root is not None:
+            self.tk_root.destroy()
         pygame.quit()
 
 if __name__ == "__main__":